@@ -0,0 +1,25 @@
+"""
+Gunicorn configuration for the Jira Connect App
+
+The workload is dominated by network waits on Jira and the LLM, so gevent
+workers let a single process serve many requests concurrently. TLS is
+terminated by nginx (see nginx.conf), which proxies plain HTTP over a unix
+socket with upstream keep-alive.
+"""
+
+import os
+
+bind = os.getenv('GUNICORN_BIND', 'unix:/run/jira_connect.sock')
+# Installed tenants live in process memory and are persisted to tenants.json by
+# that process, so the app must run as one worker; gevent supplies the concurrency
+workers = 1
+worker_class = 'gevent'
+worker_connections = 1000
+keepalive = 65
+
+# On reload or shutdown, give in-flight /enhance requests time to finish; their
+# model call is capped at 60s. (With gevent workers, gunicorn's timeout only
+# detects a hung worker and never limits a request, so it keeps its default.)
+# An /enhance?action=stream response has no overall cap and can still be cut
+# off once this grace period runs out.
+graceful_timeout = 90
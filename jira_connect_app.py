@@ -4,29 +4,190 @@ Jira Connect App for LLM Ticket Enhancement
 Integrates with existing SimpleJiraEnhancer without modifying existing classes
 """
 
+from __future__ import annotations
 
 import os
+import sys
 import json
-import jwt
 import time
-import requests
-from flask import Flask, request, jsonify, render_template_string, send_file, make_response
+import queue
+import hmac
+import base64
+import atexit
+import hashlib
+import logging
+import logging.handlers
+import tempfile
+import threading
+from flask import Flask, Response, request, jsonify, send_file
 from flask_cors import CORS
-from typing import Dict, Any, Optional
-from functools import wraps
-
-# Import existing enhancer (assumes it's in the same directory or Python path)
-from jira_issue_enhancer import JiraIssueEnhancer, LlamaJiraEnhancer
+from jinja2 import Template
+from typing import TYPE_CHECKING, Dict, Any, Iterator, Optional
+from functools import wraps, lru_cache
+
+# jwt and the enhancer (which pulls in the Jira client) are imported where they are
+# used, so requests for /health, /descriptor and static files never load them
+if TYPE_CHECKING:
+    from jira_issue_enhancer import JiraIssueEnhancer
+
+log = logging.getLogger(__name__)
+
+# VERY PERMISSIVE - headers added to every response, built once
+_PERMISSIVE_HEADERS = {
+    # Allow all origins and methods
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': '*',
+    'Access-Control-Expose-Headers': '*',
+    'Access-Control-Allow-Credentials': 'true',
+    # Very permissive CSP
+    'Content-Security-Policy': (
+        "default-src * 'unsafe-inline' 'unsafe-eval' data: blob:; "
+        "frame-ancestors *; "
+        "script-src * 'unsafe-inline' 'unsafe-eval'; "
+        "style-src * 'unsafe-inline'; "
+        "img-src * data: blob:; "
+        "connect-src *;"
+    ),
+}
+
+# Headers for preflight OPTIONS responses
+_PREFLIGHT_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': '*',
+    'Access-Control-Max-Age': '3600',
+}
+
+# Restrictive headers removed from every response
+_RESTRICTIVE_HEADERS = ('X-Frame-Options', 'X-Content-Type-Options', 'Strict-Transport-Security', 'Referrer-Policy')
+
+
+@lru_cache(maxsize=2048)
+def _token_cache_key(token: str) -> bytes:
+    """SHA-256 of a JWT, memoized so a token reused across requests is hashed once"""
+    return hashlib.sha256(token.encode()).digest()
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode a base64url JWT segment, restoring the stripped padding"""
+    return base64.urlsafe_b64decode(segment + '=' * (-len(segment) % 4))
+
+
+def _decode_segment(segment: str) -> Dict[str, Any]:
+    """Decode a JWT header or claims segment into a dict"""
+    import jwt
+
+    try:
+        value = json.loads(_b64url_decode(segment))
+    except ValueError as e:
+        raise jwt.DecodeError(f"Invalid token segment: {e}")
+    if not isinstance(value, dict):
+        raise jwt.DecodeError("Invalid token segment")
+    return value
+
+
+def _unverified_claims(token: str) -> Dict[str, Any]:
+    """Read the claims of a JWT without verifying its signature"""
+    import jwt
+
+    segments = token.split('.')
+    if len(segments) != 3:
+        raise jwt.DecodeError("Not enough segments")
+    return _decode_segment(segments[1])
+
+
+def _verify_hs256(token: str, claims: Dict[str, Any], shared_secret: str) -> Dict[str, Any]:
+    """
+    Verify an HS256 token with hmac directly and return its claims
+
+    Atlassian signs Connect tokens with HS256 and the shared secret; tokens using any
+    other algorithm are rejected. Claims are checked the way jwt.decode would with
+    algorithms=['HS256'] and no audience: exp, nbf, and no non-empty aud.
+    """
+    import jwt
+
+    header_b64, payload_b64, signature_b64 = token.split('.')
+    if _decode_segment(header_b64).get('alg') != 'HS256':
+        raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+
+    signing_input = f"{header_b64}.{payload_b64}".encode()
+    expected = hmac.new(shared_secret.encode(), signing_input, hashlib.sha256).digest()
+    try:
+        signature = _b64url_decode(signature_b64)
+    except ValueError as e:
+        raise jwt.DecodeError(f"Invalid token signature: {e}")
+    if not hmac.compare_digest(expected, signature):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    now = time.time()
+    exp = claims.get('exp')
+    if exp is not None:
+        if not isinstance(exp, (int, float)):
+            raise jwt.DecodeError("Expiration Time claim (exp) must be a number")
+        if exp <= now:
+            raise jwt.ExpiredSignatureError("Signature has expired")
+    nbf = claims.get('nbf')
+    if nbf is not None:
+        if not isinstance(nbf, (int, float)):
+            raise jwt.DecodeError("Not Before claim (nbf) must be a number")
+        if nbf > now:
+            raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+    # No audience is expected, so a token addressed to one is rejected
+    if claims.get('aud'):
+        raise jwt.InvalidAudienceError("Invalid audience")
+
+    return claims
+
+
+def _patched_gevent_monkey():
+    """gevent's monkey module if it has patched threading in this process, else None"""
+    monkey = sys.modules.get('gevent.monkey')
+    if monkey is not None and monkey.is_module_patched('threading'):
+        return monkey
+    return None
+
+
+def _run_in_os_thread(target):
+    """
+    Run target on a real OS thread
+
+    Once gevent has patched threading, a threading.Thread is a greenlet on the worker's
+    event loop, so blocking I/O in it would still stall every request; gevent's native
+    thread pool is used instead.
+    """
+    if _patched_gevent_monkey() is not None:
+        import gevent
+        gevent.get_hub().threadpool.spawn(target)
+    else:
+        threading.Thread(target=target, daemon=True).start()
+
+
+def _os_lock():
+    """A lock that synchronizes real OS threads, even when gevent has patched threading"""
+    monkey = _patched_gevent_monkey()
+    if monkey is not None:
+        return monkey.get_original('_thread', 'allocate_lock')()
+    return threading.Lock()
 
 
 class JiraConnectApp:
     """Jira Connect App for ticket enhancement"""
 
-    DEFAULT_PORT = 443
+    DEFAULT_PORT = 8000  # plain HTTP; TLS is terminated by nginx (see nginx.conf)
+    JWT_CACHE_TTL = 30  # seconds a verified token is trusted without re-verification
+    JWT_CACHE_MAXSIZE = 10000
+    FAVICON_MAX_AGE = 86400  # seconds browsers may reuse the favicon
+    HEALTH_CACHE_TTL = 1  # seconds a health response body is reused
+    ENV_VARS = ('APP_BASE_URL', 'JIRA_SERVER_URL', 'JIRA_SERVICE_ACCOUNT_EMAIL', 'JIRA_SERVICE_ACCOUNT_TOKEN')
 
     def __init__(self):
         self.app = Flask(__name__)
 
+        # jsonify: skip key sorting and pretty-printing, which are pure overhead here
+        self.app.json.sort_keys = False
+        self.app.json.compact = True
+
         # app_base_url = os.getenv('APP_BASE_URL', '')
         # jira_server_url = os.getenv('JIRA_SERVER_URL', '')
         #
@@ -47,7 +208,30 @@ class JiraConnectApp:
                  "max_age": 3600
              }})
 
+        # Environment is read once; it does not change after process start
+        self._env = {name: os.getenv(name) for name in self.ENV_VARS}
+
+        # One enhancer per tenant so its Jira connection pool is reused
+        self._enhancers = {}
+        self._enhancers_lock = threading.Lock()
+
+        # Verified JWT payloads keyed by token hash: {key: (payload, expires_at)}
+        self._jwt_cache = {}
+        self._jwt_cache_lock = threading.Lock()
+
         self.installed_tenants = self.load_tenants()
+
+        # tenants.json is written on an OS thread so handlers never block on disk I/O
+        self._save_lock = _os_lock()
+        self._tenants_dirty = False  # set on every change, cleared once a write has started from it
+        self._write_scheduled = False  # a background write is queued and has not started yet
+        atexit.register(self._flush_tenants)
+
+        # Cached /health body, regenerated at most every HEALTH_CACHE_TTL seconds
+        self._health_bytes = b''
+        self._health_ts = 0.0
+
+        self.load_static_files()
         self.setup_routes()
 
     def load_tenants(self):
@@ -58,24 +242,82 @@ class JiraConnectApp:
             return {}
 
     def save_tenants(self):
-        with open('tenants.json', 'w') as f:
-            json.dump(self.installed_tenants, f)
+        """Schedule tenants.json to be rewritten on a background OS thread"""
+        self._tenants_dirty = True
+        # Saves made before the scheduled write starts are covered by it
+        if not self._write_scheduled:
+            self._write_scheduled = True
+            _run_in_os_thread(self._background_write)
+
+    def _background_write(self):
+        """Write tenants.json off the request path, logging rather than raising failures"""
+        self._write_scheduled = False
+        try:
+            self._write_tenants()
+        except Exception as e:
+            log.error("❌ Saving tenants failed: %s", e)
+
+    def _flush_tenants(self):
+        """Write any pending save synchronously (used at interpreter exit)"""
+        # Waits out a write already in progress and only writes again if it missed a change
+        self._write_tenants()
+
+    def _write_tenants(self):
+        with self._save_lock:
+            if self._tenants_dirty:
+                self._dump_tenants()
+
+    def _dump_tenants(self):
+        """Write installed_tenants to tenants.json; the caller holds _save_lock"""
+        # Cleared before the snapshot so a change made during the write marks it dirty again
+        self._tenants_dirty = False
+        tenants = dict(self.installed_tenants)
+        # Write to a uniquely named temporary file and rename so a crash never leaves a
+        # truncated tenants.json and concurrent writers never share a temp file
+        f = tempfile.NamedTemporaryFile('w', dir='.', prefix='tenants.', suffix='.tmp', delete=False)
+        try:
+            with f:
+                json.dump(tenants, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(f.name, 'tenants.json')
+        except Exception:
+            self._tenants_dirty = True
+            os.unlink(f.name)
+            raise
+
+    def load_static_files(self):
+        """Read the descriptor, panel and favicon once; None means serve from disk"""
+        try:
+            with open('atlassian-connect.json', 'r') as f:
+                # Serialized once; the descriptor is served as-is on every request
+                self._descriptor_bytes = json.dumps(json.load(f)).encode('utf-8')
+        except (OSError, json.JSONDecodeError):
+            self._descriptor_bytes = None
+
+        try:
+            with open('panel.html', 'r') as f:
+                self._panel_template = Template(f.read(), keep_trailing_newline=True)
+        except OSError:
+            self._panel_template = None
+
+        try:
+            with open('favicon.ico', 'rb') as f:
+                self._favicon_bytes = f.read()
+            # Validators for conditional GETs, computed once
+            self._favicon_etag = hashlib.sha1(self._favicon_bytes).hexdigest()
+            self._favicon_mtime = os.path.getmtime('favicon.ico')
+        except OSError:
+            self._favicon_bytes = None
 
     def setup_routes(self):
         """Setup all Flask routes"""
         # Handle ALL OPTIONS requests - very permissive
-        @self.app.route('/<path:path>', methods=['OPTIONS'])
-        @self.app.route('/enhance', methods=['OPTIONS'])
-        @self.app.route('/panel', methods=['OPTIONS'])
-        @self.app.route('/descriptor', methods=['OPTIONS'])
-        def handle_options(path=None):
-            """Handle preflight OPTIONS requests"""
-            response = make_response('', 200)
-            response.headers['Access-Control-Allow-Origin'] = '*'
-            response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, DELETE, OPTIONS'
-            response.headers['Access-Control-Allow-Headers'] = '*'
-            response.headers['Access-Control-Max-Age'] = '3600'
-            return response
+        @self.app.before_request
+        def handle_options():
+            """Answer preflight OPTIONS requests before URL routing and view dispatch"""
+            if request.method == 'OPTIONS':
+                return '', 200, _PREFLIGHT_HEADERS
 
         @self.app.route('/')
         def serve_root():
@@ -84,7 +326,10 @@ class JiraConnectApp:
         @self.app.route('/descriptor')
         @self.app.route('/atlassian-connect.json')
         def serve_descriptor():
-            """Serve the app descriptor from a JSON file on disk"""
+            """Serve the app descriptor loaded from the JSON file on disk"""
+            if self._descriptor_bytes is not None:
+                return Response(self._descriptor_bytes, mimetype='application/json')
+
             try:
                 with open('atlassian-connect.json', 'r') as f:
                     descriptor = json.load(f)
@@ -99,8 +344,17 @@ class JiraConnectApp:
         @self.app.route('/favicon.ico')
         def favicon():
             """Serve favicon for Jira app"""
+            if self._favicon_bytes is not None:
+                response = Response(self._favicon_bytes, mimetype='image/x-icon')
+                response.set_etag(self._favicon_etag)
+                response.last_modified = self._favicon_mtime
+                response.cache_control.public = True
+                response.cache_control.max_age = self.FAVICON_MAX_AGE
+                # Answers 304 with an empty body when the browser's copy is current
+                return response.make_conditional(request)
+
             try:
-                return send_file('favicon.ico', mimetype='image/x-icon')
+                return send_file('favicon.ico', mimetype='image/x-icon', max_age=self.FAVICON_MAX_AGE, conditional=True)
             except FileNotFoundError:
                 # If ico file doesn't exist, return a 404 or create a minimal response
                 return '', 404
@@ -122,11 +376,11 @@ class JiraConnectApp:
                 }
                 self.save_tenants()
 
-                print(f"✅ App installed for tenant: {client_key}")
+                log.info("✅ App installed for tenant: %s", client_key)
                 return '', 204
 
             except Exception as e:
-                print(f"❌ Installation failed: {e}")
+                log.error("❌ Installation failed: %s", e)
                 return jsonify({'error': str(e)}), 400
 
         @self.app.route('/uninstalled', methods=['POST'])
@@ -138,42 +392,45 @@ class JiraConnectApp:
 
                 if client_key in self.installed_tenants:
                     del self.installed_tenants[client_key]
-                    print(f"✅ App uninstalled for tenant: {client_key}")
+                    log.info("✅ App uninstalled for tenant: %s", client_key)
 
                 return '', 204
 
             except Exception as e:
-                print(f"❌ Uninstallation failed: {e}")
+                log.error("❌ Uninstallation failed: %s", e)
                 return jsonify({'error': str(e)}), 400
 
         @self.app.route('/health')
         def serve_health():
             """Health check endpoint"""
-            return jsonify({
-                'status': 'healthy',
-                'installed_tenants': len(self.installed_tenants),
-                'timestamp': time.time()
-            })
+            now = time.time()
+            if now - self._health_ts > self.HEALTH_CACHE_TTL:
+                self._health_bytes = json.dumps({
+                    'status': 'healthy',
+                    'installed_tenants': len(self.installed_tenants),
+                    'timestamp': now
+                }).encode('utf-8')
+                self._health_ts = now
+            return Response(self._health_bytes, mimetype='application/json')
 
         @self.app.route('/panel')
         # @self.jwt_required
         def serve_enhancement_panel():
             """Serve the enhancement panel UI from HTML file"""
-            print(f"📋 Panel called")
             issue_key = request.args.get('issueKey')
-            print(f"📋 Panel called with issue: {issue_key}")
+            log.info("📋 Panel called with issue: %s", issue_key)
 
             # Get app base URL from environment
-            app_base_url = os.getenv('APP_BASE_URL', 'https://do.nowtech.cloud')
+            app_base_url = self._env['APP_BASE_URL'] or 'https://do.nowtech.cloud'
 
             try:
-                # Read the HTML file
-                with open('panel.html', 'r') as f:
-                    html_content = f.read()
-                # Replace placeholders with actual values
-                html_content = html_content.replace('{{ISSUE_KEY}}', issue_key or '')
-                html_content = html_content.replace('{{APP_BASE_URL}}', app_base_url)
-                return html_content
+                template = self._panel_template
+                if template is None:
+                    # Read the HTML file
+                    with open('panel.html', 'r') as f:
+                        template = Template(f.read(), keep_trailing_newline=True)
+                # Fill placeholders with actual values
+                return template.render(ISSUE_KEY=issue_key or '', APP_BASE_URL=app_base_url)
 
             except FileNotFoundError:
                 return f"""
@@ -191,7 +448,7 @@ class JiraConnectApp:
             """API endpoint for enhancement operations"""
             try:
                 action = request.args.get('action', 'preview')
-                print(f'serve_enhance - action: {action}')
+                log.info('serve_enhance - action: %s', action)
                 issue_key = request.args.get('issueKey')
                 custom_instructions = request.args.get('instructions', '')
 
@@ -202,13 +459,13 @@ class JiraConnectApp:
                 # jwt_payload = getattr(request, 'jwt_payload', {})
                 # base_url = jwt_payload.get('iss', '')
 
-                base_url = os.getenv('JIRA_SERVER_URL')
-                # Create enhancer instance using service account credentials
+                base_url = self._env['JIRA_SERVER_URL']
+                # Get enhancer instance using service account credentials
                 # (In production, you'd store these securely per tenant)
-                enhancer = self._create_enhancer_for_tenant(base_url)
+                enhancer = self._get_enhancer_for_tenant(base_url)
 
                 if action == 'preview':
-                    # Preview enhancement
+                    # Preview enhancement; its response is cached by prompt, so a following apply writes this text
                     result = enhancer.enhance_issue_description(issue_key, custom_instructions)
                     return jsonify(result)
 
@@ -220,25 +477,33 @@ class JiraConnectApp:
                         'message': message
                     })
 
+                elif action == 'stream':
+                    # Stream the model output as server-sent events while it is generated
+                    chunks = enhancer.stream_issue_description(issue_key, custom_instructions)
+                    response = Response(_sse_events(chunks), mimetype='text/event-stream')
+                    response.headers['Cache-Control'] = 'no-cache'
+                    response.headers['X-Accel-Buffering'] = 'no'  # Stop nginx from buffering the stream
+                    return response
+
                 else:
                     return jsonify({'success': False, 'error': 'Invalid action'}), 400
 
             except Exception as e:
-                print(f'serve_enhance - failed: {e}')
+                log.error('serve_enhance - failed: %s', e)
                 return jsonify({'success': False, 'error': str(e)}), 500
 
         @self.app.route('/demo')
         def serve_demo():
             """Demo endpoint that enhances a specific DIGI ticket"""
             try:
-                server_url = os.getenv('JIRA_SERVER_URL')
-                enhancer = self._create_enhancer_for_tenant(server_url)
+                server_url = self._env['JIRA_SERVER_URL']
+                enhancer = self._get_enhancer_for_tenant(server_url)
 
                 # Use a specific DIGI ticket for demo
                 ticket_key = "DIGI-894"  # Replace with actual ticket key
 
                 # Enhance the ticket
-                result = enhancer.enhance_issue_description(ticket_key)
+                result = enhancer.enhance_issue_description(ticket_key, reuse_similar=True)
 
                 if result['success']:
                     return jsonify({
@@ -260,40 +525,19 @@ class JiraConnectApp:
 
         @self.app.after_request
         def after_request(response):
-            # VERY PERMISSIVE - Allow everything
-
-            # Remove restrictive headers
-            response.headers.pop('X-Frame-Options', None)
-
-            # Allow all origins and methods
-            response.headers['Access-Control-Allow-Origin'] = '*'
-            response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, DELETE, OPTIONS'
-            response.headers['Access-Control-Allow-Headers'] = '*'
-            response.headers['Access-Control-Expose-Headers'] = '*'
-            response.headers['Access-Control-Allow-Credentials'] = 'true'
-
-            # Very permissive CSP
-            response.headers['Content-Security-Policy'] = (
-                "default-src * 'unsafe-inline' 'unsafe-eval' data: blob:; "
-                "frame-ancestors *; "
-                "script-src * 'unsafe-inline' 'unsafe-eval'; "
-                "style-src * 'unsafe-inline'; "
-                "img-src * data: blob:; "
-                "connect-src *;"
-            )
-
-            # Remove other restrictive headers
-            response.headers.pop('X-Content-Type-Options', None)
-            response.headers.pop('Strict-Transport-Security', None)
-            response.headers.pop('Referrer-Policy', None)
-
+            headers = response.headers
+            headers.update(_PERMISSIVE_HEADERS)
+            for name in _RESTRICTIVE_HEADERS:
+                if name in headers:
+                    del headers[name]
             return response
 
     def jwt_required(self, f):
         """Decorator to verify JWT tokens from Jira"""
-        print('jwt_required')
         @wraps(f)
         def decorated_function(*args, **kwargs):
+            import jwt
+
             try:
                 auth_header = request.headers.get('Authorization', '')
                 if not auth_header.startswith('JWT '):
@@ -301,16 +545,25 @@ class JiraConnectApp:
 
                 token = auth_header[4:]  # Remove 'JWT ' prefix
 
-                # Decode without verification first to get the issuer
-                unverified = jwt.decode(token, options={"verify_signature": False})
-                client_key = unverified.get('iss')
+                # Reuse the payload of a recently verified identical token
+                cache_key = _token_cache_key(token)
+                payload = self._get_cached_jwt_payload(cache_key)
 
-                if client_key not in self.installed_tenants:
-                    return jsonify({'error': 'App not installed for this tenant'}), 401
+                if payload is None:
+                    # Read the issuer from the claims segment without a full decode
+                    claims = _unverified_claims(token)
+                    client_key = claims.get('iss')
+
+                    if client_key not in self.installed_tenants:
+                        return jsonify({'error': 'App not installed for this tenant'}), 401
 
-                # Verify with the shared secret
-                shared_secret = self.installed_tenants[client_key]['shared_secret']
-                payload = jwt.decode(token, shared_secret, algorithms=['HS256'])
+                    # Verify with the shared secret
+                    shared_secret = self.installed_tenants[client_key]['shared_secret']
+                    payload = _verify_hs256(token, claims, shared_secret)
+                    self._cache_jwt_payload(cache_key, payload)
+
+                elif payload.get('iss') not in self.installed_tenants:
+                    return jsonify({'error': 'App not installed for this tenant'}), 401
 
                 # Add payload to request for use in route handlers
                 request.jwt_payload = payload
@@ -326,8 +579,53 @@ class JiraConnectApp:
 
         return decorated_function
 
+    def _get_cached_jwt_payload(self, cache_key: bytes) -> Optional[Dict[str, Any]]:
+        """Return the cached payload for a verified token, or None if absent/expired"""
+        with self._jwt_cache_lock:
+            entry = self._jwt_cache.get(cache_key)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if expires_at <= time.time():
+                del self._jwt_cache[cache_key]
+                return None
+            return payload
+
+    def _cache_jwt_payload(self, cache_key: bytes, payload: Dict[str, Any]):
+        """Remember a successfully verified token until its exp or the cache TTL"""
+        now = time.time()
+        expires_at = now + self.JWT_CACHE_TTL
+        if 'exp' in payload:
+            expires_at = min(payload['exp'], expires_at)
+
+        with self._jwt_cache_lock:
+            if len(self._jwt_cache) >= self.JWT_CACHE_MAXSIZE:
+                # Drop expired entries first, then the oldest ones
+                for key in [k for k, (_, exp) in self._jwt_cache.items() if exp <= now]:
+                    del self._jwt_cache[key]
+                while len(self._jwt_cache) >= self.JWT_CACHE_MAXSIZE:
+                    del self._jwt_cache[next(iter(self._jwt_cache))]
+            self._jwt_cache[cache_key] = (payload, expires_at)
+
+    def _get_enhancer_for_tenant(self, base_url: str) -> JiraIssueEnhancer:
+        """Return the shared enhancer for a tenant, creating it on first use"""
+        # Lock-free fast path: after the first request this is a plain dict lookup
+        enhancer = self._enhancers.get(base_url)
+        if enhancer is not None:
+            return enhancer
+
+        with self._enhancers_lock:
+            enhancer = self._enhancers.get(base_url)
+            if enhancer is None:
+                enhancer = self._create_enhancer_for_tenant(base_url)
+                self._enhancers[base_url] = enhancer
+            return enhancer
+
     def _create_enhancer_for_tenant(self, base_url: str) -> JiraIssueEnhancer:
         """Create enhancer instance for a specific tenant"""
+        # Import existing enhancer (assumes it's in the same directory or Python path)
+        from jira_issue_enhancer import JiraIssueEnhancer
+
         # In production, store tenant-specific credentials securely
         # For demo, using environment variables as fallback
 
@@ -335,10 +633,10 @@ class JiraConnectApp:
         # during installation and retrieve them here
 
         server_url = base_url
-        username = os.getenv('JIRA_SERVICE_ACCOUNT_EMAIL')
-        api_token = os.getenv('JIRA_SERVICE_ACCOUNT_TOKEN')
+        username = self._env['JIRA_SERVICE_ACCOUNT_EMAIL']
+        api_token = self._env['JIRA_SERVICE_ACCOUNT_TOKEN']
 
-        if not all([server_url, username, api_token]):
+        if not (server_url and username and api_token):
             raise ValueError("Missing Jira credentials for tenant")
 
         return JiraIssueEnhancer(
@@ -348,14 +646,40 @@ class JiraConnectApp:
         )
 
     def run(self, host='0.0.0.0', port=DEFAULT_PORT, debug=True):
-        """Run the Flask app"""
+        """Run the Flask development server (use gunicorn with wsgi.py in production)"""
         print(f"🚀 Starting Jira Connect App on {host}:{port}")
         print(f"📋 App descriptor: http://{host}:{port}/descriptor")
-        ssl_context = (
-            'fullchain.pem',
-            'privkey.pem'
-        )
-        self.app.run(host=host, port=port, debug=debug, ssl_context=ssl_context)
+        self.app.run(host=host, port=port, debug=debug)
+
+
+def _sse_events(chunks: Iterator[str]) -> Iterator[str]:
+    """Format streamed enhancement chunks as server-sent events"""
+    try:
+        for chunk in chunks:
+            yield f"data: {json.dumps({'chunk': chunk})}\n\n"
+    except Exception as e:
+        log.error('serve_enhance - stream failed: %s', e)
+        yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+        return
+    yield "event: done\ndata: {}\n\n"
+
+
+def configure_logging():
+    """
+    Send log records through a queue so handlers never block on console I/O
+
+    The level comes from LOG_LEVEL (default INFO); use WARNING in production.
+    """
+    log_queue = queue.Queue()
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, console)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
 
 
 def main():
@@ -382,6 +706,7 @@ def main():
         return
 
     # Create and run the app
+    configure_logging()
     connect_app = JiraConnectApp()
 
     # Get port from environment (useful for cloud deployment)
@@ -4,31 +4,30 @@ Jira Ticket Enhancer using atlassian-python-api library
 Clean implementation using jira.Issue objects throughout
 """
 
+from __future__ import annotations
+
 import os
-from atlassian import Jira
-from typing import Dict, Any, Optional, Tuple
+import re
+import sys
+import json
+import hashlib
+import logging
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Final, Iterator, Optional, Tuple
 import time
 
+log = logging.getLogger(__name__)
 
-class LlamaJiraEnhancer:
-    """Llama enhancer that works directly with jira.Issue objects"""
-
-    def __init__(self, ollama_host: str = "localhost", ollama_port: int = 11434, model_name: str = "llama3:8b"):
-        """
-        Initialize the Llama Jira Enhancer
-
-        Args:
-            ollama_host: Ollama server host
-            ollama_port: Ollama server port
-            model_name: Name of the model to use
-        """
-        self.base_url = f"http://{ollama_host}:{ollama_port}"
-        self.model_name = model_name
-        self.policy_rules = self._load_default_policy()
+# Issue fields the enhancer actually reads; requesting only these keeps Jira responses small
+ISSUE_FIELDS = ('summary', 'description', 'priority', 'issuetype', 'assignee', 'status', 'labels', 'components')
 
-    def _load_default_policy(self) -> str:
-        """Load default policy rules"""
-        return """
+# Default policy rules, shared by every enhancer so the prompt prefix stays identical
+_POLICY_RULES: Final[str] = """
 JIRA TICKET ENHANCEMENT POLICY:
 
 1. MANDATORY FIELDS:
@@ -61,24 +60,253 @@ JIRA TICKET ENHANCEMENT POLICY:
    - Flag missing critical information
 """
 
-    def enhance_ticket(self, issue, custom_instructions: str = "") -> Dict[str, Any]:
+# Everything before the ticket is identical for every call, so Ollama can reuse its
+# cached KV state for that prefix
+_PROMPT_TEMPLATE = """{policy}
+
+TASK: Analyze the current ticket below and provide an enhanced description that follows the policy rules above. 
+Focus ONLY on improving the description field while maintaining all the important information.
+
+Provide your response in the following format:
+
+ENHANCED DESCRIPTION:
+[Your enhanced description here - be detailed, structured, and professional]
+
+
+CURRENT TICKET:
+Key: {key}
+Title: {summary}
+Description: {description}
+Priority: {priority}
+Issue Type: {issue_type}
+Assignee: {assignee}
+Status: {status}
+Labels: {labels}
+Components: {components}
+
+
+{custom_instructions}
+
+Please enhance this ticket description now:"""
+
+
+def _nested(data: Dict[str, Any], path: Tuple[str, ...], default: Any) -> Any:
+    """Follow a path of keys through nested dicts, returning default if any step is missing"""
+    value = data
+    for key in path:
+        value = value.get(key) if isinstance(value, dict) else None
+        if value is None:
+            return default
+    return value
+
+
+def _build_session(pool_connections: int, pool_maxsize: int, max_retries=0) -> requests.Session:
+    """Create a requests session whose keep-alive connections are pooled"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=max_retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+_WORD = re.compile(r'\w+')
+
+# Pieces of the "ENHANCED DESCRIPTION:" section: its header line, and the next section header
+# that ends it - a line shorter than 50 characters with a colon and no lowercase letters
+_DESCRIPTION_HEADER = r'^(?P<header>[^\n]*?(?i:ENHANCED DESCRIPTION):[^\n]*)'
+_SECTION_HEADER = r'\n[^\S\n]*(?=[^a-z\n]*[A-Z])(?=[^a-z\n]*:)[^a-z\s](?:[^a-z\n]{0,47}[^a-z\s])?[^\S\n]*'
+
+# The header line and everything after it, up to the next section header
+_ENHANCED_DESCRIPTION = re.compile(
+    _DESCRIPTION_HEADER + r'(?P<body>.*?)' + r'(?=' + _SECTION_HEADER + r'(?:\n|\Z)|\Z)',
+    re.MULTILINE | re.DOTALL
+)
+
+# Compiled pieces for scanning a streamed response line by line
+_DESCRIPTION_HEADER_LINE = re.compile(_DESCRIPTION_HEADER, re.MULTILINE)
+_SECTION_HEADER_LINE = re.compile(_SECTION_HEADER + r'\n')
+
+
+class SimilarTicketCache:
+    """
+    Bounded cache of enhancements for near-duplicate tickets
+
+    Tickets are compared by the Jaccard similarity of their word trigrams, which catches
+    re-filed and lightly edited tickets without an embedding model.
+    """
+
+    def __init__(self, threshold: float = 0.92, maxsize: int = 256):
+        """
+        Args:
+            threshold: Minimum similarity (0-1) for a cached entry to be reused
+            maxsize: Number of tickets remembered, least recently used evicted first
+        """
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # trigram set -> cached value
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _shingles(text: str) -> frozenset:
+        words = _WORD.findall(text.lower())
+        if len(words) < 3:
+            return frozenset([tuple(words)])
+        return frozenset(zip(words, words[1:], words[2:]))
+
+    def get(self, text: str) -> Optional[Any]:
+        """Return the value stored for the most similar text, or None if none is close enough"""
+        shingles = self._shingles(text)
+        size = len(shingles)
+        best_key, best_score = None, self.threshold
+
+        with self._lock:
+            for key in self._entries:
+                # Jaccard can never exceed the ratio of the two set sizes
+                if min(size, len(key)) < best_score * max(size, len(key)):
+                    continue
+                common = len(shingles & key)
+                score = common / (size + len(key) - common)
+                if score >= best_score:
+                    best_key, best_score = key, score
+
+            if best_key is None:
+                return None
+            self._entries.move_to_end(best_key)
+            return self._entries[best_key]
+
+    def put(self, text: str, value: Any):
+        """Remember a value for this text"""
+        shingles = self._shingles(text)
+        with self._lock:
+            self._entries[shingles] = value
+            self._entries.move_to_end(shingles)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+class _DescriptionScanner:
+    """
+    Detects when the enhanced description in a streamed response is complete
+
+    Only the text from the start of the last unfinished line is kept for matching, so
+    each chunk is scanned once no matter how long the response grows.
+    """
+
+    def __init__(self):
+        self._parts = []
+        self._pending = ''
+        self._in_description = False
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far"""
+        return ''.join(self._parts)
+
+    def feed(self, chunk: str) -> bool:
+        """Add a chunk; return True once a section header line has followed the description"""
+        self._parts.append(chunk)
+        self._pending += chunk
+        if '\n' not in chunk:
+            return False
+
+        if not self._in_description:
+            match = _DESCRIPTION_HEADER_LINE.search(self._pending)
+            if match is None:
+                self._pending = self._pending[self._pending.rfind('\n') + 1:]
+                return False
+            self._in_description = True
+            self._pending = self._pending[match.end():]
+
+        if _SECTION_HEADER_LINE.search(self._pending):
+            return True
+
+        # A section header starts at a newline; keep the last one in case its line is unfinished
+        last_newline = self._pending.rfind('\n')
+        if last_newline > 0:
+            self._pending = self._pending[last_newline:]
+        return False
+
+
+class LlamaJiraEnhancer:
+    """Llama enhancer that works directly with jira.Issue objects"""
+
+    RESPONSE_CACHE_SIZE = 1024  # model responses remembered per enhancer, keyed by prompt
+    OUTPUT_TOKEN_BUDGET = 1024  # maximum tokens generated per ticket
+    MODEL_TIMEOUT = 60  # seconds a whole model call may take, within the proxy's 90s limit
+    NUM_CTX = 4096  # default context window
+
+    def __init__(self, ollama_host: str = "localhost", ollama_port: int = 11434, model_name: str = "llama3:8b",
+                 num_ctx: int = NUM_CTX):
+        """
+        Initialize the Llama Jira Enhancer
+
+        Args:
+            ollama_host: Ollama server host
+            ollama_port: Ollama server port
+            model_name: Name of the model to use
+            num_ctx: Context window sent with every request; Ollama reloads the model
+                when it changes, so it stays fixed for the enhancer's lifetime
+        """
+        self.base_url = f"http://{ollama_host}:{ollama_port}"
+        self.model_name = model_name
+        self.num_ctx = num_ctx
+        self.policy_rules = _POLICY_RULES
+
+        # Keep-alive connections to Ollama are reused across tickets
+        self._session = _build_session(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+
+        # LRU of model responses keyed by prompt digest; identical prompts skip the model
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+
+        # Enhancements of recent tickets, offered to throwaway previews of near-duplicates
+        self._similar_cache = SimilarTicketCache()
+
+    def close(self):
+        """Close pooled connections to the Ollama server"""
+        self._session.close()
+
+    def enhance_ticket(self, issue, custom_instructions: str = "", force_refresh: bool = False,
+                       reuse_similar: bool = False) -> Dict[str, Any]:
         """
         Enhance a Jira issue using the model
 
         Args:
             issue: jira.Issue object
             custom_instructions: Additional specific instructions for this ticket
+            force_refresh: Call the model even if this ticket was enhanced before
+            reuse_similar: Accept the enhancement of a recent near-identical ticket; it may
+                carry that ticket's details and is not cached for this ticket's prompt, so only
+                use it where the text is never written or confirmed for writing
 
         Returns:
             Dict with enhanced ticket data and metadata
         """
+        # Reuse the enhancement of a near-duplicate ticket if one was seen recently
+        ticket_text = self._similarity_text(issue, custom_instructions)
+        cached = self._similar_cache.get(ticket_text) if reuse_similar and not force_refresh else None
+        if cached is not None:
+            enhanced_description, response = cached
+            return {
+                "success": True,
+                "enhanced_description": enhanced_description,
+                "full_response": response,
+                "original_issue": issue,
+                "timestamp": time.time()
+            }
+
         # Build the prompt
         prompt = self._build_prompt(issue, custom_instructions)
 
         # Call the model
         try:
-            response = self._call_model(prompt)
+            response = self._cached_call_model(prompt, force_refresh)
             enhanced_description = self._extract_description_from_output(response)
+            self._similar_cache.put(ticket_text, (enhanced_description, response))
 
             return {
                 "success": True,
@@ -95,93 +323,138 @@ JIRA TICKET ENHANCEMENT POLICY:
                 "timestamp": time.time()
             }
 
-    def _build_prompt(self, issue, custom_instructions: str = "") -> str:
-        """Build the complete prompt with policy + issue data"""
-
-        fields = issue['fields']
-
-        # Format issue information
-        issue_info = f"""
-CURRENT TICKET:
-Key: {issue['key']}
-Title: {fields.get('summary', 'No title')}
-Description: {fields.get('description', 'No description')}
-Priority: {fields.get('priority', {}).get('name', 'Not set') if fields.get('priority') else 'Not set'}
-Issue Type: {fields.get('issuetype', {}).get('name', 'Not set') if fields.get('issuetype') else 'Not set'}
-Assignee: {fields.get('assignee', {}).get('displayName', 'Unassigned') if fields.get('assignee') else 'Unassigned'}
-Status: {fields.get('status', {}).get('name', 'Unknown') if fields.get('status') else 'Unknown'}
-Labels: {', '.join(fields.get('labels', [])) if fields.get('labels') else 'None'}
-Components: {', '.join([c['name'] for c in fields.get('components', [])]) if fields.get('components') else 'None'}
-"""
-
-        # Build complete prompt
-        prompt = f"""{self.policy_rules}
-
-{issue_info}
-
-{custom_instructions}
-
-TASK: Analyze the current ticket and provide an enhanced description that follows the policy rules above. 
-Focus ONLY on improving the description field while maintaining all the important information.
-
-Provide your response in the following format:
-
-ENHANCED DESCRIPTION:
-[Your enhanced description here - be detailed, structured, and professional]
-
-Please enhance this ticket description now:"""
+    def stream_ticket(self, issue, custom_instructions: str = "") -> Iterator[str]:
+        """
+        Stream the model's response for a Jira issue as it is generated
 
-        return prompt
+        Args:
+            issue: jira.Issue object
+            custom_instructions: Additional specific instructions for this ticket
 
-    def _call_model(self, prompt: str) -> str:
-        """Make API call to Ollama"""
-        import requests
+        Returns:
+            Iterator over chunks of the raw model response
+        """
+        prompt = self._build_prompt(issue, custom_instructions)
+        yield from self._stream_model(prompt)
 
-        url = f"{self.base_url}/api/generate"
+    @staticmethod
+    def _similarity_text(issue, custom_instructions: str) -> str:
+        """Text that decides whether two tickets would get the same enhancement"""
+        fields = issue['fields']
+        issue_type = _nested(fields, ('issuetype', 'name'), '')
+        return f"{issue_type}\n{fields.get('summary') or ''}\n{fields.get('description') or ''}\n{custom_instructions}"
 
-        payload = {
+    def _build_prompt(self, issue, custom_instructions: str = "") -> str:
+        """Build the complete prompt with policy + issue data"""
+        fields = issue['fields']
+        labels = fields.get('labels')
+        components = fields.get('components')
+
+        return _PROMPT_TEMPLATE.format_map({
+            'policy': self.policy_rules,
+            'key': issue['key'],
+            'summary': fields.get('summary', 'No title'),
+            'description': fields.get('description', 'No description'),
+            'priority': _nested(fields, ('priority', 'name'), 'Not set'),
+            'issue_type': _nested(fields, ('issuetype', 'name'), 'Not set'),
+            'assignee': _nested(fields, ('assignee', 'displayName'), 'Unassigned'),
+            'status': _nested(fields, ('status', 'name'), 'Unknown'),
+            'labels': ', '.join(labels) if labels else 'None',
+            'components': ', '.join([c['name'] for c in components]) if components else 'None',
+            'custom_instructions': custom_instructions,
+        })
+
+    def _build_payload(self, prompt: str) -> Dict[str, Any]:
+        """Build the Ollama generate request body"""
+        return {
             "model": self.model_name,
             "prompt": prompt,
-            "stream": False,
+            "stream": True,
+            "keep_alive": "30m",  # Keep the model and its prompt cache loaded between tickets
             "options": {
                 "temperature": 0.1,  # Low temperature for consistent results
                 "top_p": 0.9,
-                "num_ctx": 4096  # Context window
+                "num_ctx": self.num_ctx,  # Context window
+                "num_predict": self.OUTPUT_TOKEN_BUDGET
             }
         }
 
-        response = requests.post(url, json=payload, timeout=60)
-        response.raise_for_status()
+    def _cached_call_model(self, prompt: str, force_refresh: bool = False) -> str:
+        """Return the cached response for an identical prompt, calling the model on a miss"""
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+
+        if not force_refresh:
+            with self._response_cache_lock:
+                response = self._response_cache.get(key)
+                if response is not None:
+                    self._response_cache.move_to_end(key)
+                    return response
+
+        response = self._call_model(prompt)
 
-        result = response.json()
-        return result.get("response", "")
+        with self._response_cache_lock:
+            self._response_cache[key] = response
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return response
+
+    def _call_model(self, prompt: str) -> str:
+        """Make API call to Ollama, stopping generation once the enhanced description is complete"""
+        scanner = _DescriptionScanner()
+        # The request timeout only bounds the gap between chunks, so bound the whole generation here
+        deadline = time.monotonic() + self.MODEL_TIMEOUT
+        chunks = self._stream_model(prompt)
+        try:
+            for chunk in chunks:
+                # Everything after the next section header is discarded by the extraction anyway
+                if scanner.feed(chunk):
+                    break
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Model did not finish within {self.MODEL_TIMEOUT} seconds")
+        finally:
+            # Closing the stream drops the connection, which makes Ollama stop generating
+            chunks.close()
+
+        return scanner.text
+
+    def _stream_model(self, prompt: str) -> Iterator[str]:
+        """Make a streaming API call to Ollama, yielding response text as it arrives"""
+        url = f"{self.base_url}/api/generate"
+        payload = self._build_payload(prompt)
+
+        with self._session.post(url, json=payload, timeout=self.MODEL_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+
+            # Ollama streams one JSON object per line; parse the raw bytes without decoding first
+            for line in response.iter_lines(chunk_size=8192):
+                if not line:
+                    continue
+                # The final line only carries timing stats and the whole token context array,
+                # by far the largest object in the stream, so stop without parsing it
+                if b'"done":true' in line:
+                    break
+                chunk = json.loads(line)
+                if chunk.get("error"):
+                    raise RuntimeError(chunk["error"])
+                if chunk.get("response"):
+                    yield chunk["response"]
 
     def _extract_description_from_output(self, llama_output: str) -> str:
         """Extract just the enhanced description from Llama's output"""
-        lines = llama_output.split('\n')
-        description_lines = []
-        in_description = False
-
-        for line in lines:
-            if 'ENHANCED DESCRIPTION:' in line.upper():
-                in_description = True
-                # Include any text after the header on the same line
-                after_header = line.split(':', 1)
-                if len(after_header) > 1 and after_header[1].strip():
-                    description_lines.append(after_header[1].strip())
-            elif in_description:
-                # Stop if we hit another section header
-                if line.strip().isupper() and ':' in line and len(line.strip()) < 50:
-                    break
-                description_lines.append(line)
+        match = _ENHANCED_DESCRIPTION.search(llama_output)
+        if match is None:
+            return ''
 
-        return '\n'.join(description_lines).strip()
+        # Include any text after the header on the same line
+        inline = match.group('header').split(':', 1)[1].strip()
+        return (inline + match.group('body')).strip()
 
 
 class JiraIssueEnhancer:
     """Simplified Jira ticket enhancer using atlassian-python-api"""
 
-    def __init__(self, server_url: str, username: str, api_token: str):
+    def __init__(self, server_url: str, username: str, api_token: str, search_batch_size: int = 100):
         """
         Initialize with Jira Cloud credentials
 
@@ -189,34 +462,74 @@ class JiraIssueEnhancer:
             server_url: Your Jira URL (e.g., https://company.atlassian.net)
             username: Your email address
             api_token: Your API token
+            search_batch_size: Issues requested per search page (Jira Cloud caps this at 100)
         """
+        # Imported here: atlassian-python-api loads dozens of submodules
+        from atlassian import Jira
+
         self.jira = Jira(
             url=server_url,
             username=username,
             password=api_token,  # API token goes in password field
-            cloud=True  # Important for Jira Cloud
+            cloud=True,  # Important for Jira Cloud
+            # Reuse connections across calls; back off and retry when Jira rate limits (429),
+            # honouring its Retry-After header
+            session=_build_session(
+                pool_connections=20,
+                pool_maxsize=100,
+                max_retries=Retry(
+                    total=5,
+                    status_forcelist=[429],
+                    allowed_methods=frozenset(['GET', 'PUT']),
+                    backoff_factor=1,
+                    respect_retry_after_header=True,
+                    raise_on_status=False
+                )
+            )
         )
 
+        self.search_batch_size = search_batch_size
+
         # Initialize the Llama enhancer
         self.llama_enhancer = LlamaJiraEnhancer()
 
     def get_issue(self, ticket_key: str):
-        """Get issue object"""
-        return self.jira.issue(ticket_key)
+        """Get issue object with the fields used for enhancement"""
+        return self.jira.issue(ticket_key, fields=','.join(ISSUE_FIELDS))
 
-    def search_project_issues(self, project_key: str, max_results: int = 50) -> list:
-        """Search issues in project and return list of issue objects"""
-        jql = f"project = {project_key} ORDER BY created DESC"
-        result = self.jira.jql(jql, limit=max_results)
-        return result['issues']
+    def search_project_issues(self, project_key: str, max_results: int = 50, fields: Tuple[str, ...] = ISSUE_FIELDS) -> list:
+        """
+        Search issues in project and return list of issue objects
 
-    def enhance_issue_description(self, issue, custom_instructions: str = "") -> Dict[str, Any]:
+        The requested fields come back with the search, so the issues can be enhanced
+        directly without a get_issue call per key.
+        """
+        jql = f"project = {project_key} ORDER BY created DESC"
+        fields_param = ','.join(fields)
+        issues = []
+        seen = set()
+        # Page through results in as few round trips as Jira allows
+        while len(issues) < max_results:
+            limit = min(self.search_batch_size, max_results - len(issues))
+            result = self.jira.jql(jql, fields=fields_param, start=len(issues), limit=limit)
+            # Never collect an issue twice, even if Jira repeats a page
+            page = [issue for issue in result['issues'] if issue['key'] not in seen]
+            seen.update(issue['key'] for issue in page)
+            issues.extend(page)
+            # A short page is the last one. A response without total is token-paged and
+            # ignores start, so only its first page can be trusted.
+            if len(page) < limit or 'total' not in result or len(issues) >= result['total']:
+                break
+        return issues
+
+    def enhance_issue_description(self, issue, custom_instructions: str = "", reuse_similar: bool = False) -> Dict[str, Any]:
         """
         Enhance an issue's description using Llama
 
         Args:
             issue: jira.Issue object or ticket key string
             custom_instructions: Additional instructions for enhancement
+            reuse_similar: Accept a near-duplicate ticket's enhancement (throwaway previews only)
 
         Returns:
             Dict with enhancement results
@@ -225,7 +538,24 @@ class JiraIssueEnhancer:
         if isinstance(issue, str):
             issue = self.get_issue(issue)
 
-        return self.llama_enhancer.enhance_ticket(issue, custom_instructions)
+        return self.llama_enhancer.enhance_ticket(issue, custom_instructions, reuse_similar=reuse_similar)
+
+    def stream_issue_description(self, issue, custom_instructions: str = "") -> Iterator[str]:
+        """
+        Stream an issue's enhancement from Llama as it is generated
+
+        Args:
+            issue: jira.Issue object or ticket key string
+            custom_instructions: Additional instructions for enhancement
+
+        Returns:
+            Iterator over chunks of the raw model response
+        """
+        # Convert string to issue object if needed (before streaming starts, so lookup errors surface here)
+        if isinstance(issue, str):
+            issue = self.get_issue(issue)
+
+        return self.llama_enhancer.stream_ticket(issue, custom_instructions)
 
     def to_string(self, issue) -> str:
         """
@@ -248,8 +578,8 @@ class JiraIssueEnhancer:
         result = f"\n🎫 ISSUE {issue['key']}\n"
         result += "=" * 50 + "\n"
         result += f"📋 Title: {fields.get('summary', 'No title')}\n"
-        result += f"🏷️  Type: {fields.get('issuetype', {}).get('name', 'Unknown')}\n"
-        result += f"⚡ Priority: {fields.get('priority', {}).get('name', 'Not set') if fields.get('priority') else 'Not set'}\n"
+        result += f"🏷️  Type: {_nested(fields, ('issuetype', 'name'), 'Unknown')}\n"
+        result += f"⚡ Priority: {_nested(fields, ('priority', 'name'), 'Not set')}\n"
         result += f"\n📝 DESCRIPTION ({len(original_desc)} chars):\n"
         result += "-" * 30 + "\n"
         result += original_desc
@@ -270,28 +600,31 @@ class JiraIssueEnhancer:
         if isinstance(issue, str):
             issue = self.get_issue(issue)
 
-        # Print current issue
-        print(self.to_string(issue))
+        # Print current issue (one write, flushed before the slow model call)
+        sys.stdout.write(f"{self.to_string(issue)}\n\n🤖 ENHANCING WITH LLAMA...\n")
+        sys.stdout.flush()
 
-        # Get enhancement
-        print(f"\n🤖 ENHANCING WITH LLAMA...")
-        enhancement_result = self.enhance_issue_description(issue, custom_instructions)
+        # Get enhancement (nothing is written, so a near-duplicate's enhancement will do)
+        enhancement_result = self.enhance_issue_description(issue, custom_instructions, reuse_similar=True)
 
         if enhancement_result['success']:
             enhanced_desc = enhancement_result['enhanced_description']
             original_desc = issue['fields'].get('description', '')
-
-            print(f"\n✨ ENHANCED DESCRIPTION ({len(enhanced_desc)} chars):")
-            print("-" * 30)
-            print(enhanced_desc)
-
-            print(f"\n📊 ENHANCEMENT SUMMARY:")
-            print(f"   • Original length: {len(original_desc)} characters")
-            print(f"   • Enhanced length: {len(enhanced_desc)} characters")
-            print(
-                f"   • Change: {'+' if len(enhanced_desc) > len(original_desc) else ''}{len(enhanced_desc) - len(original_desc)} characters")
+            change = len(enhanced_desc) - len(original_desc)
+
+            parts = [
+                f"\n✨ ENHANCED DESCRIPTION ({len(enhanced_desc)} chars):",
+                "-" * 30,
+                enhanced_desc,
+                f"\n📊 ENHANCEMENT SUMMARY:",
+                f"   • Original length: {len(original_desc)} characters",
+                f"   • Enhanced length: {len(enhanced_desc)} characters",
+                f"   • Change: {'+' if change > 0 else ''}{change} characters",
+            ]
         else:
-            print(f"\n❌ Enhancement failed: {enhancement_result['error']}")
+            parts = [f"\n❌ Enhancement failed: {enhancement_result['error']}"]
+
+        sys.stdout.write("\n".join(parts) + "\n")
 
     def update_issue_description(self, issue, enhanced_description: str) -> Tuple[bool, str]:
         """
@@ -304,12 +637,8 @@ class JiraIssueEnhancer:
         Returns:
             Tuple of (success, message)
         """
-        # Convert string to issue object if needed
-        if isinstance(issue, str):
-            issue_key = issue
-            issue = self.get_issue(issue)
-        else:
-            issue_key = issue['key']
+        # Only the key is needed for the PUT, so skip fetching the issue first
+        issue_key = issue if isinstance(issue, str) else issue['key']
 
         try:
             self.jira.issue_update(
@@ -320,6 +649,29 @@ class JiraIssueEnhancer:
         except Exception as e:
             return False, f"❌ Failed to update {issue_key}: {str(e)}"
 
+    def update_issue_descriptions(self, updates: Dict[str, str], max_workers: int = 5) -> Dict[str, Tuple[bool, str]]:
+        """
+        Update the descriptions of several issues concurrently
+
+        Args:
+            updates: Mapping of issue key to its new description
+            max_workers: Maximum number of concurrent Jira updates
+
+        Returns:
+            Mapping of issue key to (success, message)
+        """
+        outcomes = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.update_issue_description, issue_key, description): issue_key
+                       for issue_key, description in updates.items()}
+            for future in as_completed(futures):
+                issue_key = futures[future]
+                try:
+                    outcomes[issue_key] = future.result()
+                except Exception as e:
+                    outcomes[issue_key] = (False, f"❌ Failed to update {issue_key}: {str(e)}")
+        return outcomes
+
     def enhance_and_update_issue(self, issue, custom_instructions: str = "") -> Tuple[bool, str]:
         """
         Enhance an issue and update it in Jira
@@ -331,15 +683,14 @@ class JiraIssueEnhancer:
         Returns:
             Tuple of (success, message)
         """
-        # Convert string to issue object if needed
+        # Convert string to issue object if needed; it is fetched once and passed down
         if isinstance(issue, str):
-            issue_key = issue
             issue = self.get_issue(issue)
-        else:
-            issue_key = issue['key']
+        issue_key = issue['key']
 
-        # Print current issue
-        print(self.to_string(issue))
+        # Current issue, logged at debug level; this also runs on the Connect app's request path
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("%s", self.to_string(issue))
 
         # Enhance
         enhancement_result = self.enhance_issue_description(issue, custom_instructions)
@@ -437,18 +788,43 @@ def preview_specific_issue(ticket_key: str):
 
 
 def batch_enhance_project(project_key: str, max_issues: int = 10):
-    """Example: Enhance multiple issues in a project"""
+    """
+    Example: Enhance multiple issues in a project
+
+    Enhancements run on a pool of TICKET_ENH_WORKERS threads. By default this matches
+    OLLAMA_NUM_PARALLEL (else 5), so every parallel slot on the Ollama server is kept
+    busy and the server batches the concurrent requests together. The enhanced
+    descriptions are then written back on a separate pool of JIRA_UPDATE_WORKERS
+    threads (default 5).
+    """
     enhancer = load_from_env()
     issues = enhancer.search_project_issues(project_key, max_issues)
-
-    results = []
-    for issue in issues:
-        issue_key = issue['key']
-        print(f"Processing {issue_key}...")
-        success, message = enhancer.enhance_and_update_issue(issue)
-        results.append({'issue': issue_key, 'success': success, 'message': message})
-
-    return results
+    max_workers = int(os.getenv('TICKET_ENH_WORKERS') or os.getenv('OLLAMA_NUM_PARALLEL') or '5')
+
+    # Stage 1: enhance every issue
+    outcomes = {}
+    enhanced = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(enhancer.enhance_issue_description, issue): issue['key'] for issue in issues}
+        for future in as_completed(futures):
+            issue_key = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {'success': False, 'error': str(e)}
+
+            if result['success']:
+                print(f"Enhanced {issue_key}")
+                enhanced[issue_key] = result['enhanced_description']
+            else:
+                outcomes[issue_key] = (False, f"❌ Enhancement failed for {issue_key}: {result['error']}")
+
+    # Stage 2: write the enhanced descriptions to Jira
+    update_workers = int(os.getenv('JIRA_UPDATE_WORKERS', '5'))
+    outcomes.update(enhancer.update_issue_descriptions(enhanced, max_workers=update_workers))
+
+    return [{'issue': issue['key'], 'success': outcomes[issue['key']][0], 'message': outcomes[issue['key']][1]}
+            for issue in issues]
 
 
 if __name__ == "__main__":
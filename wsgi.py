@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for running the Jira Connect App under gunicorn
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+# Patch blocking stdlib I/O before anything imports requests, so outbound
+# Jira and LLM calls yield to other requests instead of blocking the worker
+from gevent import monkey
+monkey.patch_all()
+
+from jira_connect_app import JiraConnectApp, configure_logging
+
+configure_logging()
+app = JiraConnectApp().app